@@ -5,24 +5,58 @@ Test script to verify voice agent setup
 
 import os
 import sys
+import json
+import argparse
+import functools
+import importlib
 
+# Cached device enumeration, invalidated when the host API/device counts change
+DEVICE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "voice_agent", "devices.json")
+
+@functools.lru_cache(maxsize=1)
 def test_imports():
-    """Test if all required modules can be imported"""
+    """Test if all required modules can be imported (result is cached per process)"""
     print("Testing imports...")
     
     try:
-        import pyaudio
+        importlib.import_module("pyaudio")
         print("✓ PyAudio imported successfully")
     except ImportError as e:
         print(f"✗ PyAudio import failed: {e}")
         return False
     
     try:
-        from semantic_kernel.connectors.ai.open_ai import (
-            OpenAIChatCompletion,
-            OpenAIAudioToText,
-            OpenAITextToAudio,
-        )
+        importlib.import_module("httpx")
+        print("✓ httpx imported successfully")
+    except ImportError as e:
+        print(f"✗ httpx import failed: {e}")
+        return False
+    
+    try:
+        # Needed for httpx.AsyncClient(http2=True)
+        importlib.import_module("h2")
+        print("✓ h2 (HTTP/2 support) imported successfully")
+    except ImportError as e:
+        print(f"✗ h2 import failed: {e} (install httpx[http2])")
+        return False
+    
+    try:
+        openai = importlib.import_module("openai")
+        if not hasattr(openai, "AsyncOpenAI"):
+            raise ImportError("missing AsyncOpenAI")
+        print("✓ OpenAI client imported successfully")
+    except ImportError as e:
+        print(f"✗ OpenAI client import failed: {e}")
+        return False
+    
+    try:
+        open_ai = importlib.import_module("semantic_kernel.connectors.ai.open_ai")
+        missing = [
+            name for name in ("OpenAIChatCompletion", "OpenAIChatPromptExecutionSettings")
+            if not hasattr(open_ai, name)
+        ]
+        if missing:
+            raise ImportError(f"missing {', '.join(missing)}")
         print("✓ Semantic Kernel OpenAI connectors imported successfully")
     except ImportError as e:
         print(f"✗ Semantic Kernel import failed: {e}")
@@ -30,6 +64,42 @@ def test_imports():
     
     return True
 
+def _enumerate_devices(p):
+    """Return (input_devices, output_devices), using the on-disk cache when valid"""
+    import pyaudio
+    cache_key = [pyaudio.get_portaudio_version(), p.get_host_api_count(), p.get_device_count()]
+    
+    try:
+        with open(DEVICE_CACHE_FILE) as f:
+            cached = json.load(f)
+        if isinstance(cached, dict) and cached.get("key") == cache_key:
+            return cached["input_devices"], cached["output_devices"]
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    input_devices = []
+    output_devices = []
+    
+    for i in range(p.get_device_count()):
+        device_info = p.get_device_info_by_index(i)
+        if device_info['maxInputChannels'] > 0:
+            input_devices.append(device_info['name'])
+        if device_info['maxOutputChannels'] > 0:
+            output_devices.append(device_info['name'])
+    
+    try:
+        os.makedirs(os.path.dirname(DEVICE_CACHE_FILE), exist_ok=True)
+        with open(DEVICE_CACHE_FILE, "w") as f:
+            json.dump({
+                "key": cache_key,
+                "input_devices": input_devices,
+                "output_devices": output_devices,
+            }, f)
+    except OSError as e:
+        print(f"  (could not write device cache: {e})")
+    
+    return input_devices, output_devices
+
 def test_audio_devices():
     """Test audio device availability"""
     print("\nTesting audio devices...")
@@ -38,15 +108,7 @@ def test_audio_devices():
         import pyaudio
         p = pyaudio.PyAudio()
         
-        input_devices = []
-        output_devices = []
-        
-        for i in range(p.get_device_count()):
-            device_info = p.get_device_info_by_index(i)
-            if device_info['maxInputChannels'] > 0:
-                input_devices.append(device_info['name'])
-            if device_info['maxOutputChannels'] > 0:
-                output_devices.append(device_info['name'])
+        input_devices, output_devices = _enumerate_devices(p)
         
         print(f"✓ Found {len(input_devices)} input device(s):")
         for device in input_devices:
@@ -64,20 +126,45 @@ def test_audio_devices():
         return False
 
 def test_environment():
-    """Test environment variables"""
+    """Test environment variables (including those loaded from .env)"""
     print("\nTesting environment variables...")
     
-    api_key = os.getenv("OPENAI_API_KEY")
-    if api_key:
-        print("✓ OPENAI_API_KEY is set")
-        return True
-    else:
+    try:
+        from dotenv import load_dotenv
+        from voice_agent import PLACEHOLDER_API_KEYS
+    except ImportError as e:
+        print(f"✗ Could not load the voice agent configuration: {e}")
+        return False
+    load_dotenv()
+    
+    api_key = os.getenv("OPENAI_API_KEY", "").strip()
+    if not api_key:
         print("✗ OPENAI_API_KEY is not set")
-        print("  Set it with: export OPENAI_API_KEY='your-key-here'")
+        print("  Copy .env.example to .env and put your key in it")
         return False
+    if api_key in PLACEHOLDER_API_KEYS:
+        print("✗ OPENAI_API_KEY is still the placeholder from .env.example")
+        print("  Replace it with your real key in .env")
+        return False
+    print("✓ OPENAI_API_KEY is set")
+    return True
 
 def main():
     """Run all tests"""
+    parser = argparse.ArgumentParser(description="Verify the voice agent setup")
+    parser.add_argument(
+        "--refresh-devices",
+        action="store_true",
+        help="ignore the cached audio device list and enumerate devices again",
+    )
+    args = parser.parse_args()
+    
+    if args.refresh_devices:
+        try:
+            os.remove(DEVICE_CACHE_FILE)
+        except FileNotFoundError:
+            pass
+    
     print("Voice Agent Setup Test")
     print("=" * 30)
     
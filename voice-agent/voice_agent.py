@@ -5,51 +5,178 @@ A complete voice interaction system with speech-to-text, AI chat, and text-to-sp
 """
 
 import os
+import sys
 import asyncio
+import functools
+import importlib
 import logging
-import tempfile
-from typing import Optional
+import math
+import re
+import struct
+import time
+import uuid
+from array import array
+from collections import deque
+from typing import AsyncIterator, Callable, Optional
 from dotenv import load_dotenv
 
-import pyaudio
-from semantic_kernel.connectors.ai.open_ai import (
-    OpenAIChatCompletion,
-    OpenAIAudioToText,
-    OpenAITextToAudio,
-    OpenAITextToAudioExecutionSettings,
-    OpenAIChatPromptExecutionSettings,
-)
-from semantic_kernel.contents import AudioContent, ChatHistory
-
 # Set up logging for debugging and info
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ----------------------
+# Lazy Imports
+# ----------------------
+# PyAudio and the Semantic Kernel OpenAI connectors (which pull in the OpenAI
+# SDK, pydantic and httpx) are only imported when first needed, so probes like
+# test_setup.py don't pay for them. Set VOICE_AGENT_EAGER_IMPORT=1 to resolve
+# everything at import time instead (useful in CI to surface missing packages).
+_LAZY_IMPORTS = {
+    "httpx": ("httpx", None),
+    "AsyncOpenAI": ("openai", "AsyncOpenAI"),
+    "pyaudio": ("pyaudio", None),
+    "OpenAIChatCompletion": ("semantic_kernel.connectors.ai.open_ai", "OpenAIChatCompletion"),
+    "OpenAIChatPromptExecutionSettings": ("semantic_kernel.connectors.ai.open_ai", "OpenAIChatPromptExecutionSettings"),
+    "ChatHistory": ("semantic_kernel.contents", "ChatHistory"),
+}
+
+def __getattr__(name):
+    """Resolve heavy third-party names on first access (PEP 562)"""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    # Cache in the module namespace so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+if os.getenv("VOICE_AGENT_EAGER_IMPORT") == "1":
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
+
+OPENAI_API_BASE = "https://api.openai.com/v1"
+
+# Re-warm the OpenAI connection after this long without a request, before
+# the server side drops it
+CONNECTION_IDLE_SECONDS = 60
+
+# Placeholder values from .env.example and the docs; treated as "no key set"
+PLACEHOLDER_API_KEYS = frozenset({"your-openai-api-key-here", "your-api-key-here"})
+
+# End of a sentence in streamed GPT output: terminal punctuation followed by
+# whitespace, or a line break
+SENTENCE_END = re.compile(r"[.!?]\s+|\n+")
+
+# Words ending in "." that don't end a sentence ("Dr. Smith", "e.g. this")
+ABBREVIATIONS = frozenset({
+    "mr.", "mrs.", "ms.", "dr.", "prof.", "sr.", "jr.", "st.",
+    "vs.", "etc.", "e.g.", "i.e.", "no.", "approx.",
+})
+
+def _pop_sentences(buffer: str):
+    """
+    Split the completed sentences off the front of buffer.
+    Returns (sentences, remainder). A "." after an abbreviation, a single
+    initial ("J. Smith") or a list number ("1. ") is not treated as the end
+    of a sentence.
+    """
+    sentences = []
+    start = 0
+    for match in SENTENCE_END.finditer(buffer):
+        if buffer[match.start()] == ".":
+            words = buffer[start:match.start() + 1].split()
+            last = words[-1].lower() if words else ""
+            if last in ABBREVIATIONS or (len(last) == 2 and last[0].isalpha()):
+                continue
+            # A bare number opening the sentence is a list marker ("1. Drink water.")
+            if len(words) == 1 and last[:-1].isdigit():
+                continue
+        sentence = buffer[start:match.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+    return sentences, buffer[start:]
+
+# Bytes read from stdin by _ainput() that are past the line it returned
+_stdin_pending = bytearray()
+
+async def _ainput(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    The loop watches stdin for readability and reads it directly, so no
+    thread is ever left blocked in input() when the wait is cancelled
+    (e.g. by Ctrl+C). Raises EOFError when stdin is closed.
+    """
+    print(prompt, end="", flush=True)
+    loop = asyncio.get_running_loop()
+    fd = sys.stdin.fileno()
+    while b"\n" not in _stdin_pending:
+        readable = loop.create_future()
+        try:
+            loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+        except NotImplementedError:
+            # Event loops without add_reader (Windows' proactor loop)
+            return await asyncio.to_thread(input)
+        try:
+            await readable
+        finally:
+            loop.remove_reader(fd)
+        data = os.read(fd, 4096)
+        if not data:
+            raise EOFError
+        _stdin_pending.extend(data)
+    line, _, rest = bytes(_stdin_pending).partition(b"\n")
+    _stdin_pending[:] = rest
+    return line.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r")
+
 # ----------------------
 # Audio Recorder Class
 # ----------------------
 class AudioRecorder:
     """Handles audio recording using PyAudio"""
-    def __init__(self, sample_rate=16000, channels=1, chunk_size=1024):
+    def __init__(self, sample_rate=16000, channels=1, chunk_size=256):
+        import pyaudio
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = chunk_size
         self.audio = pyaudio.PyAudio()
-        self.frames = []
+        # Resolve PyAudio constants once rather than importing on every call
+        self._pa_int16 = pyaudio.paInt16
+        self._pa_continue = pyaudio.paContinue
+        self.sample_width = self.audio.get_sample_size(self._pa_int16)
         self.stream = None
+        # Chunks pushed by the PortAudio callback thread, not yet consumed.
+        # deque append/popleft are thread-safe, so no lock is needed.
+        self._pending = deque()
+        # Endpointing (voice activity detection) state
+        self._heard_speech = False
+        self._voiced_chunks = 0
+        self._speech_chunks = 0
+        self._silent_run = 0
+        self._silence_chunks = 0
+        self._threshold_dbfs = 0.0
 
     def start_recording(self):
         """Start the audio stream and begin recording"""
-        self.frames = []
+        self._pending.clear()
+        # Callback mode: PortAudio delivers each buffer from its own thread
         self.stream = self.audio.open(
-            format=pyaudio.paInt16,
+            format=self._pa_int16,
             channels=self.channels,
             rate=self.sample_rate,
             input=True,
             frames_per_buffer=self.chunk_size,
+            stream_callback=self._on_audio,
         )
         logger.info("Recording started...")
 
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        """PortAudio input callback: queue the captured buffer for the reader"""
+        self._pending.append(in_data)
+        return (None, self._pa_continue)
+
     def stop_recording(self):
         """Stop the audio stream and finish recording"""
         if self.stream is not None:
@@ -58,24 +185,80 @@ class AudioRecorder:
             self.stream = None
         logger.info("Recording stopped.")
 
-    def save_audio(self, filename):
-        """Save the recorded audio frames to a WAV file"""
-        import wave
-        wf = wave.open(filename, 'wb')
-        wf.setnchannels(self.channels)
-        wf.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
-        wf.setframerate(self.sample_rate)
-        wf.writeframes(b''.join(self.frames))
-        wf.close()
-        logger.info(f"Audio saved to {filename}")
-
-    def record_audio(self, duration=5):
-        """Record audio for a fixed duration (in seconds)"""
-        self.start_recording()
-        for _ in range(0, int(self.sample_rate / self.chunk_size * duration)):
-            data = self.stream.read(self.chunk_size)
-            self.frames.append(data)
-        self.stop_recording()
+    def wav_header(self):
+        """
+        Build a WAV header for a stream of unknown length.
+        The RIFF and data sizes are left at 0xFFFFFFFF so the header can be
+        sent before recording finishes.
+        """
+        byte_rate = self.sample_rate * self.channels * self.sample_width
+        block_align = self.channels * self.sample_width
+        return (
+            b"RIFF" + struct.pack("<I", 0xFFFFFFFF) + b"WAVE"
+            + b"fmt " + struct.pack(
+                "<IHHIIHH", 16, 1, self.channels, self.sample_rate,
+                byte_rate, block_align, self.sample_width * 8,
+            )
+            + b"data" + struct.pack("<I", 0xFFFFFFFF)
+        )
+
+    def _chunk_dbfs(self, data):
+        """Return the RMS level of a chunk of 16-bit PCM in dBFS"""
+        samples = array("h", data)
+        if not samples:
+            return -math.inf
+        rms = math.sqrt(sum(s * s for s in samples) / len(samples))
+        return 20 * math.log10(rms / 32768) if rms else -math.inf
+
+    def _reset_endpointer(self, silence_ms, threshold_dbfs, min_speech_ms):
+        """Reset voice activity detection for a new utterance"""
+        chunk_ms = 1000 * self.chunk_size / self.sample_rate
+        self._silence_chunks = max(1, round(silence_ms / chunk_ms))
+        self._speech_chunks = max(1, round(min_speech_ms / chunk_ms))
+        self._threshold_dbfs = threshold_dbfs
+        self._heard_speech = False
+        self._voiced_chunks = 0
+        self._silent_run = 0
+
+    def _end_of_utterance(self, data):
+        """
+        Feed one chunk to the endpointer.
+        Returns True once speech has been heard and followed by enough
+        consecutive silent chunks. Speech only counts as heard after
+        min_speech_ms of chunks above the threshold in total, so a click,
+        breath or the Enter keypress doesn't arm the silence countdown.
+        """
+        if self._chunk_dbfs(data) >= self._threshold_dbfs:
+            self._voiced_chunks += 1
+            if self._voiced_chunks >= self._speech_chunks:
+                self._heard_speech = True
+            self._silent_run = 0
+        else:
+            self._silent_run += 1
+        return self._heard_speech and self._silent_run >= self._silence_chunks
+
+    async def record_stream(self, max_duration=15, silence_ms=800, threshold_dbfs=-40, min_speech_ms=150) -> AsyncIterator[bytes]:
+        """
+        Yield PCM chunks from a recording started with start_recording()
+        until the speaker pauses (or max_duration seconds pass), then stop it.
+        The callback buffers audio captured before iteration begins, so
+        nothing is lost while the caller is still connecting.
+        """
+        self._reset_endpointer(silence_ms, threshold_dbfs, min_speech_ms)
+        chunk_seconds = self.chunk_size / self.sample_rate
+        try:
+            for _ in range(0, int(self.sample_rate / self.chunk_size * max_duration)):
+                while not self._pending:
+                    if not self.stream.is_active():
+                        return
+                    await asyncio.sleep(chunk_seconds)
+                data = self._pending.popleft()
+                yield data
+                if self._end_of_utterance(data):
+                    break
+        finally:
+            # Closing the device blocks, so keep it off the event loop
+            await asyncio.to_thread(self.stop_recording)
 
     def cleanup(self):
         """Release PyAudio resources"""
@@ -87,22 +270,41 @@ class AudioRecorder:
 class AudioPlayer:
     """Handles audio playback using PyAudio"""
     def __init__(self):
+        import pyaudio
         self.audio = pyaudio.PyAudio()
+        self._pa_int16 = pyaudio.paInt16
+        # Output stream is opened once and reused across replies
+        self._stream = None
+        self._rate = None
 
-    def play_audio(self, audio_data, sample_rate=24000):
-        """Play audio data through the default output device"""
-        stream = self.audio.open(
-            format=pyaudio.paInt16,
+    def _open_stream(self, sample_rate):
+        """Open (or reopen at a new rate) the persistent output stream"""
+        self._close_stream()
+        self._stream = self.audio.open(
+            format=self._pa_int16,
             channels=1,
             rate=sample_rate,
             output=True
         )
-        stream.write(audio_data)
-        stream.stop_stream()
-        stream.close()
+        self._rate = sample_rate
+
+    def _close_stream(self):
+        """Close the cached output stream, if any"""
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+            self._rate = None
+
+    def play_audio(self, audio_data, sample_rate=24000):
+        """Play audio data through the default output device"""
+        if self._stream is None or self._rate != sample_rate:
+            self._open_stream(sample_rate)
+        self._stream.write(audio_data)
 
     def cleanup(self):
         """Release PyAudio resources"""
+        self._close_stream()
         self.audio.terminate()
 
 # ----------------------
@@ -117,17 +319,90 @@ class SimpleVoiceAgent:
     - Text-to-speech (OpenAI TTS)
     - Conversation history
     """
-    def __init__(self, system_prompt: str = "You are a helpful voice assistant."):
+    def __init__(self, system_prompt: str = "You are a helpful voice assistant.", api_key: Optional[str] = None):
+        import httpx
+        from openai import AsyncOpenAI
+        from semantic_kernel.connectors.ai.open_ai import (
+            OpenAIChatCompletion,
+            OpenAIChatPromptExecutionSettings,
+        )
+        from semantic_kernel.contents import ChatHistory
+        # Read configuration from the environment once and pass it explicitly
+        self._api_key = api_key or os.environ["OPENAI_API_KEY"]
+        self.chat_model_id = os.getenv("OPENAI_CHAT_MODEL_ID", "gpt-4o-mini")
+        self.audio_model_id = os.getenv("OPENAI_AUDIO_MODEL_ID", "whisper-1")
+        self.tts_model_id = os.getenv("OPENAI_TTS_MODEL_ID", "tts-1")
+        # One pooled HTTP/2 connection to OpenAI shared by chat, STT and TTS,
+        # so the TLS handshake is paid once and kept alive between turns
+        self._last_request = 0.0
+        self._http = httpx.AsyncClient(
+            http2=True,
+            base_url=OPENAI_API_BASE,
+            headers={"Authorization": f"Bearer {self._api_key}"},
+            timeout=60,
+            limits=httpx.Limits(keepalive_expiry=600),
+            event_hooks={"request": [self._note_request]},
+        )
         # Initialize OpenAI connectors via Semantic Kernel
-        self.chat_service = OpenAIChatCompletion(ai_model_id=os.getenv("OPENAI_CHAT_MODEL_ID", "gpt-4o-mini"))
-        self.audio_to_text = OpenAIAudioToText(ai_model_id=os.getenv("OPENAI_AUDIO_MODEL_ID", "whisper-1"))
-        self.text_to_audio = OpenAITextToAudio(ai_model_id=os.getenv("OPENAI_TTS_MODEL_ID", "tts-1"))
+        self.chat_service = OpenAIChatCompletion(
+            ai_model_id=self.chat_model_id,
+            api_key=self._api_key,
+            async_client=AsyncOpenAI(api_key=self._api_key, http_client=self._http),
+        )
+        self.chat_settings = OpenAIChatPromptExecutionSettings(
+            max_tokens=2000,
+            temperature=0.7,
+            top_p=0.8,
+        )
+        # Speech-to-text and text-to-speech go straight to the REST API so
+        # audio can stream in both directions
+        self.tts_voice = "alloy"
+        # At most this many sentences are synthesized at once; the rest wait their turn
+        self._tts_slots = asyncio.Semaphore(3)
         self.history = ChatHistory()
         self.system_prompt = system_prompt
+        # Only the last max_turns user/assistant exchanges are sent to GPT
+        self.max_turns = 12
         self.recorder = AudioRecorder()
         self.player = AudioPlayer()
         # Add system prompt to conversation history
         self.history.add_system_message(self.system_prompt)
+        # Open the connection in the background while the user gets ready
+        try:
+            self._warmup = asyncio.get_running_loop().create_task(self._warm_up_connection())
+        except RuntimeError:
+            # Constructed outside an event loop; the first request connects instead
+            self._warmup = None
+
+    async def _note_request(self, request):
+        """httpx request hook: remember when the connection was last used"""
+        self._last_request = time.monotonic()
+
+    async def _keep_connection_warm(self):
+        """
+        Re-warm the connection whenever it has gone CONNECTION_IDLE_SECONDS
+        without a request. Runs while waiting for the user; a connection
+        used by the previous turn is left alone.
+        """
+        while True:
+            idle = time.monotonic() - self._last_request
+            if idle >= CONNECTION_IDLE_SECONDS:
+                await self._warm_up_connection()
+            else:
+                await asyncio.sleep(CONNECTION_IDLE_SECONDS - idle)
+
+    async def _warm_up_connection(self):
+        """Establish the TLS connection to OpenAI ahead of the first request"""
+        try:
+            response = await self._http.get("/models", timeout=5)
+        except Exception as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+            return
+        if response.is_success:
+            logger.debug("OpenAI connection warmed up")
+        else:
+            # Most likely a bad API key; surface it before the first turn fails
+            logger.warning(f"Connection warm-up got HTTP {response.status_code} from OpenAI")
 
     async def record_and_transcribe(self) -> Optional[str]:
         """
@@ -136,81 +411,167 @@ class SimpleVoiceAgent:
         """
         try:
             print("[DEBUG] 🎙️ Starting audio recording...")
-            # Create a temporary file for the audio
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_filename = temp_file.name
-            print(f"[DEBUG] 📁 Created temp file: {temp_filename}")
-            print("Recording for 5 seconds... Speak now!")
-            # Record audio for 5 seconds
-            self.recorder.record_audio(duration=5)
+            # Open the microphone before connecting to Whisper so the start of
+            # the utterance is captured even if the connection is slow; opening
+            # the device blocks, so do it in a worker thread
+            await asyncio.to_thread(self.recorder.start_recording)
+            print("Recording... Speak now! (stops when you pause)")
+            # Record until the user pauses while the audio is uploaded to Whisper
+            print("[DEBUG] 🧠 Streaming audio to Whisper for transcription...")
+            text = await self._transcribe_stream(self.recorder.record_stream())
             print("[DEBUG] ✅ Audio recording completed")
-            # Save the recorded audio to the temp file
-            self.recorder.save_audio(temp_filename)
-            print("[DEBUG] 💾 Audio saved to temp file")
-            # Convert audio to text using OpenAI Whisper
-            print("[DEBUG] 🧠 Sending audio to Whisper for transcription...")
-            audio_content = AudioContent.from_audio_file(temp_filename)
-            text_content = await self.audio_to_text.get_text_content(audio_content)
-            print(f"[DEBUG] 📝 Whisper transcription: '{text_content.text}'")
-            # Clean up the temp file
-            os.unlink(temp_filename)
-            print("[DEBUG] 🗑️ Temp file cleaned up")
-            return text_content.text
+            print(f"[DEBUG] 📝 Whisper transcription: '{text}'")
+            return text
         except Exception as e:
+            # Make sure the microphone is released if the upload failed mid-recording
+            await asyncio.to_thread(self.recorder.stop_recording)
             logger.error(f"Error recording/transcribing: {e}")
             print(f"[DEBUG] ❌ Transcription failed: {e}")
             return None
 
-    async def get_ai_response(self, user_input: str) -> str:
+    async def _transcribe_stream(self, pcm_chunks: AsyncIterator[bytes]) -> str:
+        """
+        Send a live PCM stream to the Whisper transcription endpoint.
+        The multipart body is generated on the fly: the WAV header goes out
+        first and each recorded chunk follows as soon as it is captured.
+        """
+        boundary = uuid.uuid4().hex
+
+        async def body():
+            yield (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="model"\r\n\r\n'
+                f"{self.audio_model_id}\r\n"
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="file"; filename="speech.wav"\r\n'
+                f"Content-Type: audio/wav\r\n\r\n"
+            ).encode()
+            yield self.recorder.wav_header()
+            async for chunk in pcm_chunks:
+                yield chunk
+            yield f"\r\n--{boundary}--\r\n".encode()
+
+        response = await self._http.post(
+            "/audio/transcriptions",
+            content=body(),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        )
+        response.raise_for_status()
+        return response.json()["text"]
+
+    async def get_ai_response(self, user_input: str, on_sentence: Optional[Callable[[str], None]] = None) -> str:
         """
         Get an AI-generated response for the user's input using OpenAI GPT.
         Maintains conversation history for context.
+        The reply is streamed; each completed sentence is passed to
+        on_sentence (if given) while the rest is still being generated.
         """
         try:
             print(f"[DEBUG] 💬 Adding user message to history: '{user_input}'")
             # Add user message to conversation history
             self.history.add_user_message(user_input)
             print(f"[DEBUG] 📚 Chat history now has {len(self.history.messages)} messages")
-            # Get AI response from OpenAI GPT
+            # Stream the AI response from OpenAI GPT
             print("[DEBUG] 🤖 Sending request to GPT...")
-            response = await self.chat_service.get_chat_message_content(
+            parts = []
+            buffer = ""
+            async for chunk in self.chat_service.get_streaming_chat_message_content(
                 chat_history=self.history,
-                settings=OpenAIChatPromptExecutionSettings(
-                    max_tokens=2000,
-                    temperature=0.7,
-                    top_p=0.8,
-                ),
-            )
-            print(f"[DEBUG] 🤖 GPT response: '{response.content}'")
+                settings=self.chat_settings,
+            ):
+                if chunk is None or not chunk.content:
+                    continue
+                parts.append(chunk.content)
+                buffer += chunk.content
+                # Hand off every completed sentence
+                sentences, buffer = _pop_sentences(buffer)
+                if on_sentence is not None:
+                    for sentence in sentences:
+                        on_sentence(sentence)
+            # Flush whatever is left after the last sentence break
+            if buffer.strip() and on_sentence is not None:
+                on_sentence(buffer.strip())
+            content = "".join(parts)
+            print(f"[DEBUG] 🤖 GPT response: '{content}'")
             # Add assistant response to history
-            self.history.add_assistant_message(response.content)
+            self.history.add_assistant_message(content)
+            self._prune_history()
             print(f"[DEBUG] 📚 Chat history updated: {len(self.history.messages)} messages")
-            return response.content
+            return content
         except Exception as e:
             logger.error(f"Error getting AI response: {e}")
             print(f"[DEBUG] ❌ GPT request failed: {e}")
-            return "I'm sorry, I encountered an error processing your request."
+            message = "I'm sorry, I encountered an error processing your request."
+            if on_sentence is not None:
+                on_sentence(message)
+            return message
+
+    def _prune_history(self):
+        """
+        Keep the system prompt plus the last max_turns exchanges so the
+        prompt sent to GPT stops growing with the length of the session.
+        """
+        keep = 2 * self.max_turns
+        if len(self.history.messages) > 1 + keep:
+            del self.history.messages[1:-keep]
+
+    def _queue_speech(self, playback: asyncio.Queue, text: str):
+        """
+        Start synthesizing text right away and queue its audio for playback.
+        Synthesis of later sentences overlaps playback of earlier ones, up to
+        three requests at a time; only the writes to the output stream are
+        serialized (see _play_queued).
+        """
+        pcm = asyncio.Queue()
+        task = asyncio.create_task(self._synthesize(text, pcm))
+        playback.put_nowait((pcm, task))
 
-    async def speak_response(self, text: str):
+    async def _play_queued(self, playback: asyncio.Queue):
         """
-        Convert the AI's text response to speech and play it using OpenAI TTS.
+        Play queued sentences in order until a None sentinel arrives.
+        A single consumer keeps playback in order on the shared output stream.
+        """
+        while (item := await playback.get()) is not None:
+            pcm, task = item
+            await self._play_pcm(pcm)
+            await task
+
+    async def _synthesize(self, text: str, pcm: asyncio.Queue):
+        """
+        Stream raw 24 kHz 16-bit mono PCM for text from OpenAI TTS into pcm,
+        ending with a None sentinel (also on failure).
         """
         try:
-            print(f"[DEBUG] 🔊 Converting text to speech: '{text}'")
-            # Convert text to audio using OpenAI TTS
-            audio_content = await self.text_to_audio.get_audio_content(
-                text, 
-                OpenAITextToAudioExecutionSettings(response_format="wav")
-            )
-            print(f"[DEBUG] 🔊 TTS generated {len(audio_content.data)} bytes of audio")
-            # Play the audio response
-            print("[DEBUG] 🔊 Playing audio response...")
-            self.player.play_audio(audio_content.data)
-            print("[DEBUG] 🔊 Audio playback completed")
+            async with self._tts_slots:
+                print(f"[DEBUG] 🔊 Converting text to speech: '{text}'")
+                received = 0
+                async with self._http.stream(
+                    "POST",
+                    "/audio/speech",
+                    json={
+                        "model": self.tts_model_id,
+                        "voice": self.tts_voice,
+                        "input": text,
+                        "response_format": "pcm",
+                    },
+                ) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(4096):
+                        received += len(chunk)
+                        pcm.put_nowait(chunk)
+            print(f"[DEBUG] 🔊 TTS streamed {received} bytes of audio")
         except Exception as e:
             logger.error(f"Error converting text to speech: {e}")
             print(f"[DEBUG] ❌ TTS failed: {e}")
             print(f"Assistant: {text}")
+        finally:
+            pcm.put_nowait(None)
+
+    async def _play_pcm(self, pcm: asyncio.Queue):
+        """Play PCM chunks from pcm as they arrive, until the None sentinel"""
+        while (chunk := await pcm.get()) is not None:
+            # stream.write blocks until the device takes the audio
+            await asyncio.to_thread(self.player.play_audio, chunk)
 
     async def conversation_loop(self):
         """
@@ -223,15 +584,20 @@ class SimpleVoiceAgent:
         """
         print("Simple Voice Agent Started!")
         print("Instructions:")
-        print("- Press Enter to start recording (speak for 5 seconds)")
+        print("- Press Enter to start recording (stops when you pause, up to 15 seconds)")
         print("- Type 'exit' and press Enter to quit")
         print("- The agent will respond with voice")
         print()
         while True:
             try:
                 print("[DEBUG] 🔄 Starting new conversation turn...")
-                # Wait for user to press Enter or type exit
-                user_choice = input("Press Enter to start recording (or type 'exit' to quit): ")
+                # Keep the connection warm in the background while waiting for the user
+                keep_warm = asyncio.create_task(self._keep_connection_warm())
+                try:
+                    # Wait for user to press Enter or type exit
+                    user_choice = await _ainput("Press Enter to start recording (or type 'exit' to quit): ")
+                finally:
+                    keep_warm.cancel()
                 # Check for exit command in text input
                 if user_choice.lower().strip() == "exit":
                     print("[DEBUG] 👋 User chose to exit via text input")
@@ -251,25 +617,43 @@ class SimpleVoiceAgent:
                     print("[DEBUG] 👋 User chose to exit via voice command")
                     print("Goodbye!")
                     break
-                # Get AI response
+                # Get AI response, speaking each sentence as soon as it is complete
                 print("[DEBUG] 🤖 Starting AI response generation...")
-                response = await self.get_ai_response(user_input)
-                print(f"[DEBUG] ✅ AI response generated: '{response}'")
-                print(f"Assistant: {response}")
-                # Speak the response
-                print("[DEBUG] 🔊 Starting speech synthesis...")
-                await self.speak_response(response)
+                playback = asyncio.Queue()
+                speaker = asyncio.create_task(self._play_queued(playback))
+                try:
+                    response = await self.get_ai_response(
+                        user_input, on_sentence=functools.partial(self._queue_speech, playback)
+                    )
+                    print(f"[DEBUG] ✅ AI response generated: '{response}'")
+                    print(f"Assistant: {response}")
+                finally:
+                    playback.put_nowait(None)
+                # Wait for the remaining sentences to finish playing
+                print("[DEBUG] 🔊 Finishing speech synthesis...")
+                await speaker
                 print("[DEBUG] ✅ Conversation turn completed")
                 print()
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # asyncio.run() turns Ctrl+C into cancellation of the main task
                 print("\n[DEBUG] 👋 User interrupted with Ctrl+C")
                 print("Goodbye!")
                 break
+            except EOFError:
+                print("\n[DEBUG] 👋 Input closed")
+                print("Goodbye!")
+                break
             except Exception as e:
                 logger.error(f"Error in conversation loop: {e}")
                 print(f"[DEBUG] ❌ Conversation loop error: {e}")
                 print("An error occurred. Please try again.")
 
+    async def close_connections(self):
+        """Close the shared OpenAI HTTP connection pool"""
+        if self._warmup is not None:
+            self._warmup.cancel()
+        await self._http.aclose()
+
     def cleanup(self):
         """Release all resources used by the agent"""
         self.recorder.cleanup()
@@ -291,20 +675,21 @@ async def main():
     load_dotenv()
     print("[DEBUG] 📄 Environment variables loaded")
     
-    # Check if OpenAI API key is available
-    if not os.getenv("OPENAI_API_KEY"):
+    # Check if OpenAI API key is available; fail fast if it is not
+    api_key = os.environ.get("OPENAI_API_KEY", "").strip()
+    if not api_key or api_key in PLACEHOLDER_API_KEYS:
         print("[DEBUG] ❌ OpenAI API key not found")
-        print("Error: OPENAI_API_KEY not found in environment variables.")
         print("Please create a .env file with your OpenAI API key:")
         print("OPENAI_API_KEY=your-api-key-here")
-        return
+        sys.exit("Error: OPENAI_API_KEY not found in environment variables.")
     
     print("[DEBUG] ✅ OpenAI API key loaded from .env file.")
     
     # Create voice agent with a system prompt
     print("[DEBUG] 🤖 Initializing Voice Agent...")
     agent = SimpleVoiceAgent(
-        system_prompt="You are a helpful voice assistant. Keep your responses concise and natural for voice interaction."
+        system_prompt="You are a helpful voice assistant. Keep your responses concise and natural for voice interaction.",
+        api_key=api_key,
     )
     print("[DEBUG] ✅ Voice Agent initialized successfully")
     try:
@@ -314,8 +699,13 @@ async def main():
     finally:
         # Clean up resources on exit
         print("[DEBUG] 🧹 Cleaning up resources...")
+        await agent.close_connections()
         agent.cleanup()
         print("[DEBUG] ✅ Cleanup completed")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # Already handled in conversation_loop; asyncio.run() re-raises it
+        pass 
\ No newline at end of file